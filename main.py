@@ -1,10 +1,75 @@
+import bisect
+import concurrent.futures
 import os
+import re
 import tkinter as tk
+import types
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 import tkinter.font as tkfont
 from typing import Optional
 
+import _find_kernel
+
+# Loads larger than this are appended to the Text widget in slices scheduled
+# via after_idle, so the UI keeps painting while a big note streams in.
+_BULK_INSERT_CHUNK = 1 << 23  # 8 MiB
+
+# Interval between polls of a pending background read/write.
+_IO_POLL_MS = 30
+
+# Theme palettes, built once at import instead of on every theme apply.
+_THEMES = types.MappingProxyType({
+    "light": {
+        "bg": "#ffffff",
+        "fg": "#1f2937",
+        "panel_bg": "#f8fafc",
+        "gutter_bg": "#eef2f7",
+        "gutter_fg": "#64748b",
+        "insert": "#2563eb",
+        "select_bg": "#dbeafe",
+        "status_bg": "#f8fafc",
+        "status_fg": "#6b7280",
+        "current_line_bg": "#f7fbff",
+    },
+    "dark": {
+        "bg": "#111827",
+        "fg": "#e5e7eb",
+        "panel_bg": "#0b1220",
+        "gutter_bg": "#0f172a",
+        "gutter_fg": "#94a3b8",
+        "insert": "#60a5fa",
+        "select_bg": "#374151",
+        "status_bg": "#111827",
+        "status_fg": "#9ca3af",
+        "current_line_bg": "#111c2e",
+    },
+})
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def _count_words(content: str) -> int:
+    # Iterate matches in C instead of str.split(), which would allocate an
+    # intermediate list of every word in the document.
+    return sum(1 for _ in _WORD_RE.finditer(content))
+
+
+def _read_file(path: str) -> str:
+    # Runs on the I/O worker thread; must not touch any Tk objects.
+    # Unbuffered raw read: the whole file lands in one bytes object (sized
+    # from fstat by FileIO.readall) with a single decode — no BufferedReader
+    # copy or incremental-decoder passes in between.
+    with open(path, "rb", buffering=0) as f:
+        return f.read().decode("utf-8")
+
+
+def _write_file(path: str, chunks: list[str]) -> None:
+    # Runs on the I/O worker thread; must not touch any Tk objects.
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for chunk in chunks:
+            f.write(chunk)
+
 
 class NoteApp:
     """A simple GUI note taking app using Tkinter."""
@@ -14,7 +79,8 @@ class NoteApp:
         self.root.title("Note — Untitled")
         self.root.geometry("900x700")
 
-        self.current_file_path: Optional[str] = None
+        self._current_file_path: Optional[str] = None
+        self._current_basename: str = ""
         self.is_modified: bool = False
 
         # UI state
@@ -24,6 +90,45 @@ class NoteApp:
         self.autosave_enabled_var = tk.BooleanVar(value=True)
         self.autosave_interval_ms: int = 30_000
         self._autosave_after_id: Optional[str] = None
+        self._pending_refresh: Optional[str] = None
+        self._gutter_items: list[int] = []
+        self._gutter_dirty: bool = False
+        self._gutter_after_id: Optional[str] = None
+        self._status_after: Optional[str] = None
+        self._last_status: str = ""
+        self._last_status_right: str = ""
+        self._last_title: str = ""
+        self._current_line_range: Optional[tuple[str, str]] = None
+        self.find_window: Optional[tk.Toplevel] = None
+        self._find_preview_path: Optional[str] = None
+
+        # Find state: per-pattern cache of match ranges, invalidated on edit,
+        # plus the last Find Next scan as (pattern, [(start, end) offsets]).
+        self._find_cache: dict[str, list[tuple[str, str]]] = {}
+        self._find_next_cache: Optional[tuple[str, list[tuple[int, int]]]] = None
+        self._find_ranges: list[tuple[str, str]] = []
+        self._highlight_job: Optional[str] = None
+        self._highlight_acc: list[tuple[str, str]] = []
+
+        # Single-worker pool so reads/writes happen off the Tk main loop;
+        # one worker keeps file operations ordered.
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_save_fut: Optional["concurrent.futures.Future[None]"] = None
+        self._io_busy: bool = False
+        self._loading: bool = False
+        self._resetting_modified: bool = False
+
+        # Cached document statistics, maintained incrementally so the status
+        # bar never has to re-scan the whole buffer on a keystroke.
+        self._char_count: int = 0
+        self._word_count: int = 0
+        self._line_count: int = 1
+        self._active_line: int = 1
+        self._active_line_words: int = 0
+        self._active_line_text: str = ""
+        # Cumulative character offset of each line start/end, so offset <->
+        # line.col conversions are pure Python instead of Tcl index parsing.
+        self._line_offsets: list[int] = [0]
 
         self._init_style()
         self._configure_fonts()
@@ -177,70 +282,116 @@ class NoteApp:
         self.root.config(menu=self.menubar)
 
     def _create_bindings(self) -> None:
-        self.root.bind("<Control-n>", lambda e: self._wrap_event(self.new_file))
-        self.root.bind("<Control-o>", lambda e: self._wrap_event(self.open_file))
-        self.root.bind("<Control-s>", lambda e: self._wrap_event(self.save_file))
-        self.root.bind("<Control-S>", lambda e: self._wrap_event(self.save_file_as))
-        self.root.bind("<Control-q>", lambda e: self._wrap_event(self.on_exit))
-        self.root.bind("<Control-f>", lambda e: self._wrap_event(self.open_find_dialog))
-        self.root.bind("<Control-t>", lambda e: self._wrap_event(self.toggle_theme))
-        self.root.bind("<Control-p>", lambda e: self._wrap_event(self.open_command_palette))
-
-        # Zoom text
-        self.root.bind("<Control-minus>", lambda e: self._wrap_event(lambda: self._adjust_font_size(-1)))
-        self.root.bind("<Control-equal>", lambda e: self._wrap_event(lambda: self._adjust_font_size(+1)))
-        self.root.bind("<Control-underscore>", lambda e: self._wrap_event(lambda: self._adjust_font_size(-1)))
-        self.root.bind("<Control-plus>", lambda e: self._wrap_event(lambda: self._adjust_font_size(+1)))
+        # One dispatch table and a single shared closure shape, instead of a
+        # hand-written wrapper lambda (and its Tcl script) per accelerator.
+        accelerators = (
+            ("<Control-n>", self.new_file),
+            ("<Control-o>", self.open_file),
+            ("<Control-s>", self.save_file),
+            ("<Control-S>", self.save_file_as),
+            ("<Control-q>", self.on_exit),
+            ("<Control-f>", self.open_find_dialog),
+            ("<Control-t>", self.toggle_theme),
+            ("<Control-p>", self.open_command_palette),
+            # Zoom text
+            ("<Control-minus>", lambda: self._adjust_font_size(-1)),
+            ("<Control-equal>", lambda: self._adjust_font_size(+1)),
+            ("<Control-underscore>", lambda: self._adjust_font_size(-1)),
+            ("<Control-plus>", lambda: self._adjust_font_size(+1)),
+        )
+        for sequence, fn in accelerators:
+            self.root.bind(sequence, lambda e, f=fn: (f(), "break")[1])
 
         self.text_area.bind("<<Modified>>", self._on_text_modified)
-        self.text_area.bind("<KeyRelease>", self._on_cursor_or_view_changed)
-        self.text_area.bind("<ButtonRelease-1>", self._on_cursor_or_view_changed)
-        self.text_area.bind("<MouseWheel>", self._on_cursor_or_view_changed)
-        self.text_area.bind("<Button-4>", self._on_cursor_or_view_changed)
-        self.text_area.bind("<Button-5>", self._on_cursor_or_view_changed)
-        self.text_area.bind("<Configure>", self._on_cursor_or_view_changed)
+        for sequence in ("<KeyRelease>", "<ButtonRelease-1>", "<MouseWheel>", "<Button-4>", "<Button-5>", "<Configure>"):
+            self.text_area.bind(sequence, self._on_cursor_or_view_changed)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_exit)
 
-    def _wrap_event(self, fn):
-        fn()
-        return "break"
-
     def _event_generate_and_focus(self, sequence: str) -> None:
         self.text_area.event_generate(sequence)
         self.text_area.focus_set()
+        # A synthetic KeyPress has no matching KeyRelease, so a paste/cut/
+        # undo triggered from the menu or palette would otherwise bypass the
+        # refresh pipeline entirely once the buffer is already dirty.
+        self._schedule_refresh()
+        self._queue_autosave()
 
     def _on_text_modified(self, event=None) -> None:
+        # Tk's <<Modified>> fires only on the clean->dirty transition now
+        # that the flag is reset solely on save/load, so this runs once per
+        # edit cycle; per-keystroke bookkeeping lives in the debounced
+        # refresh instead.
+        if self._resetting_modified:
+            # Resetting the flag itself fires <<Modified>>; skip the
+            # round-trip through edit_modified() for that echo.
+            return
+        if self._loading:
+            # Bulk load in progress: the cascade is pointless, _finish_load
+            # resets all state once the content is in.
+            return
         if self.text_area.edit_modified():
+            was_modified = self.is_modified
             self.is_modified = True
-            self._update_window_title()
-            self._update_status_bar()
-            self._highlight_current_line()
-            self._update_line_numbers()
+            if not was_modified:
+                self._update_window_title()
+            self._schedule_refresh()
             self._queue_autosave()
-            self.text_area.edit_modified(False)
+
+    @property
+    def current_file_path(self) -> Optional[str]:
+        return self._current_file_path
+
+    @current_file_path.setter
+    def current_file_path(self, path: Optional[str]) -> None:
+        # Parse the path once on assignment; the title updater sits on the
+        # modification hot path and shouldn't re-split it every time.
+        self._current_file_path = path
+        self._current_basename = os.path.basename(path) if path else ""
 
     def _update_window_title(self) -> None:
-        filename = os.path.basename(self.current_file_path) if self.current_file_path else "Untitled"
+        filename = self._current_basename or "Untitled"
         modified_marker = "*" if self.is_modified else ""
-        self.root.title(f"Note — {filename}{modified_marker}")
+        title = f"Note — {filename}{modified_marker}"
+        # Tk does real work on every title() set; skip it when unchanged.
+        if title != self._last_title:
+            self.root.title(title)
+            self._last_title = title
 
     def _update_status_bar(self, event=None) -> None:
+        if self._io_busy:
+            # Keep the "Loading…"/"Saving…" message until the worker is done.
+            return
         index = self.text_area.index("insert")
         line_str, col_str = index.split(".")
         modified_label = "Modified" if self.is_modified else "Saved"
-        content = self.text_area.get("1.0", "end-1c")
-        char_count = len(content)
-        word_count = len(content.split()) if content else 0
+        char_count = self._char_count
+        word_count = self._word_count
         try:
             sel_length = len(self.text_area.get("sel.first", "sel.last"))
         except tk.TclError:
             sel_length = 0
         sel_part = f" | Sel {sel_length}" if sel_length else ""
-        left = f"{modified_label} | Ln {int(line_str)}, Col {int(col_str) + 1}{sel_part}"
+        # line_str is already a plain integer string; no need to re-parse it.
+        left = f"{modified_label} | Ln {line_str}, Col {int(col_str) + 1}{sel_part}"
         right = f"{char_count} chars | {word_count} words"
-        self.status_var.set(left)
-        self.status_right_var.set(right)
+        # Setting a StringVar repaints the label even when nothing changed;
+        # skip the Tcl round-trip for identical text.
+        if left != self._last_status:
+            self.status_var.set(left)
+            self._last_status = left
+        if right != self._last_status_right:
+            self.status_right_var.set(right)
+            self._last_status_right = right
+
+    def _mark_buffer_clean(self) -> None:
+        # The single place the modified flag is re-armed: save, new and load.
+        # Everywhere else leaves it set, so Tk's <<Modified>> event fires
+        # once per clean->dirty cycle instead of storming on every keypress.
+        self.is_modified = False
+        self._resetting_modified = True
+        self.text_area.edit_modified(False)
+        self._resetting_modified = False
 
     def maybe_save_changes(self) -> bool:
         if not self.is_modified:
@@ -253,12 +404,16 @@ class NoteApp:
         return True
 
     def new_file(self) -> None:
+        if self._io_busy or self._loading:
+            return
         if not self.maybe_save_changes():
             return
         self.text_area.delete("1.0", tk.END)
         self.current_file_path = None
-        self.is_modified = False
         self.text_area.edit_reset()
+        self._mark_buffer_clean()
+        self._set_counts_from_text("")
+        self._current_line_range = None
         self._update_window_title()
         self._update_status_bar()
         self._clear_find_highlights()
@@ -266,6 +421,10 @@ class NoteApp:
         self._update_line_numbers()
 
     def open_file(self) -> None:
+        if self._io_busy or self._loading:
+            # A read/write (or streaming insert) is in flight; interleaving
+            # a second load would garble the buffer.
+            return
         if not self.maybe_save_changes():
             return
         file_path = filedialog.askopenfilename(
@@ -278,17 +437,65 @@ class NoteApp:
         )
         if not file_path:
             return
+        # Read on the worker so a slow disk or network share never freezes
+        # the UI; the poll callback applies the content on the main thread.
+        self._begin_io("Loading…")
+        fut = self._io_executor.submit(_read_file, file_path)
+        self.root.after(_IO_POLL_MS, self._poll_load, fut, file_path)
+
+    def _poll_load(self, fut: "concurrent.futures.Future[str]", file_path: str) -> None:
+        if not fut.done():
+            self.root.after(_IO_POLL_MS, self._poll_load, fut, file_path)
+            return
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = fut.result()
         except Exception as exc:
+            self._end_io()
             messagebox.showerror("Open Failed", f"Could not open file.\n\n{exc}")
             return
+        # Raise the loading guard before the delete: it fires the modified
+        # cascade, and a refresh scheduled by it would recount a half-built
+        # buffer between insert chunks.
+        self._loading = True
         self.text_area.delete("1.0", tk.END)
-        self.text_area.insert("1.0", content)
         self.current_file_path = file_path
-        self.is_modified = False
+        self._set_counts_from_text(content)
+        self._insert_content(content)
+
+    def _insert_content(self, content: str, offset: int = 0) -> None:
+        if offset == 0:
+            # Bulk-load fast path: no undo-stack population and no modified
+            # cascade while the content streams in.
+            self.text_area.configure(undo=False)
+        else:
+            # Re-enabled just around the programmatic insert; see below.
+            self.text_area.configure(state="normal")
+        index = "1.0" if offset == 0 else tk.END
+        # Call straight into Tcl, skipping the Python wrapper's argument
+        # normalization on these multi-MB strings.
+        self.text_area.tk.call(self.text_area._w, "insert", index, content[offset:offset + _BULK_INSERT_CHUNK])
+        if offset + _BULK_INSERT_CHUNK < len(content):
+            # Disabled between chunks so keystrokes can't interleave into
+            # the stream (and then be marked clean by _finish_load); a
+            # disabled widget also rejects programmatic inserts, hence the
+            # toggling above.
+            self.text_area.configure(state="disabled")
+            self.root.after_idle(self._insert_content, content, offset + _BULK_INSERT_CHUNK)
+        else:
+            self._finish_load()
+
+    def _finish_load(self) -> None:
+        self.text_area.configure(state="normal", undo=True)
+        self._loading = False
+        # The I/O guard stays up until here so a Save pressed while a big
+        # file is still streaming in can't write a truncated buffer.
+        self._end_io()
         self.text_area.edit_reset()
+        # A refresh that slipped in mid-stream (e.g. a stray click) may have
+        # recounted the partial buffer; reconcile with the final content.
+        self._recount_all()
+        self._mark_buffer_clean()
+        self._current_line_range = None
         self._clear_find_highlights()
         self._update_window_title()
         self._update_status_bar()
@@ -296,23 +503,71 @@ class NoteApp:
         self._update_line_numbers()
 
     def save_file(self) -> bool:
+        if self._io_busy or self._loading:
+            # Refuse rather than race a pending read/write or a load that is
+            # still streaming into the widget.
+            return False
         if self.current_file_path is None:
             return self.save_file_as()
-        try:
-            content = self.text_area.get("1.0", tk.END)
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
-                f.write(content.rstrip("\n"))
-                f.write("\n")
-        except Exception as exc:
-            messagebox.showerror("Save Failed", f"Could not save file.\n\n{exc}")
-            return False
-        self.is_modified = False
+        # Snapshot the buffer on the main thread, write it on the worker.
+        chunks = self._collect_buffer_chunks()
+        self._begin_io("Saving…")
+        fut = self._io_executor.submit(_write_file, self.current_file_path, chunks)
+        self._pending_save_fut = fut
+        self.root.after(_IO_POLL_MS, self._poll_save, fut)
+        self._mark_buffer_clean()
         self._update_window_title()
+        return True
+
+    def _collect_buffer_chunks(self) -> list[str]:
+        # Text.dump returns every text segment of the document in a single
+        # Tcl call — no monolithic copy and no get() round-trip per line.
+        # Trailing blank lines are normalized to a single final newline by
+        # trimming only the tail of the list, not rstrip-ing a full copy.
+        lines = [value for _key, value, _index in self.text_area.dump("1.0", "end-1c", text=True)]
+        while lines and lines[-1] in ("", "\n"):
+            lines.pop()
+        if lines:
+            lines[-1] = lines[-1].rstrip("\n") + "\n"
+        else:
+            lines = ["\n"]
+        return lines
+
+    def _poll_save(self, fut: "concurrent.futures.Future[None]") -> None:
+        if fut is not self._pending_save_fut:
+            # Already settled elsewhere (the exit path waits on it directly).
+            return
+        if not fut.done():
+            self.root.after(_IO_POLL_MS, self._poll_save, fut)
+            return
+        self._pending_save_fut = None
+        self._end_io()
+        exc = fut.exception()
+        if exc is not None:
+            self.is_modified = True
+            self._update_window_title()
+            messagebox.showerror("Save Failed", f"Could not save file.\n\n{exc}")
+            return
         self._update_status_bar()
         self._clear_autosave_artifacts()
-        return True
+
+    def _begin_io(self, message: str) -> None:
+        self._io_busy = True
+        self.status_var.set(message)
+        for w in (self.btn_new, self.btn_open, self.btn_save):
+            w.state(["disabled"])
+
+    def _end_io(self) -> None:
+        self._io_busy = False
+        # The Loading…/Saving… message bypassed the dedupe cache; force the
+        # next status update through.
+        self._last_status = ""
+        for w in (self.btn_new, self.btn_open, self.btn_save):
+            w.state(["!disabled"])
 
     def save_file_as(self) -> bool:
+        if self._io_busy or self._loading:
+            return False
         initial_dir = os.path.dirname(self.current_file_path) if self.current_file_path else os.getcwd()
         file_path = filedialog.asksaveasfilename(
             title="Save As",
@@ -335,17 +590,40 @@ class NoteApp:
     def on_exit(self) -> None:
         if not self.maybe_save_changes():
             return
+        fut = self._pending_save_fut
+        if fut is not None:
+            # Nothing left to keep responsive, so block until the write
+            # lands; a failure here must not be silently thrown away with
+            # the window.
+            exc = fut.exception()
+            self._pending_save_fut = None
+            if exc is not None:
+                self._end_io()
+                self.is_modified = True
+                self._update_window_title()
+                messagebox.showerror("Save Failed", f"Could not save file.\n\n{exc}")
+                return
+            # _poll_save never runs once the window is gone; do its cleanup
+            # so a quit-with-save doesn't leave the .autosave file behind.
+            self._clear_autosave_artifacts()
+        self._io_executor.shutdown(wait=False)
         self.root.destroy()
 
     def open_find_dialog(self) -> None:
-        if hasattr(self, "find_window") and self.find_window.winfo_exists():
+        # The dialog is built once; closing it only withdraws the window so
+        # reopening is a single map call instead of recreating every widget.
+        if self.find_window is not None and self.find_window.winfo_exists():
+            self.find_window.deiconify()
             self.find_window.lift()
+            self.find_entry.select_range(0, tk.END)
+            self.find_entry.focus_set()
             return
         self.find_window = tk.Toplevel(self.root)
         self.find_window.title("Find")
         self.find_window.transient(self.root)
         self.find_window.resizable(False, False)
-        self.find_window.geometry("360x120")
+        self.find_window.protocol("WM_DELETE_WINDOW", self.find_window.withdraw)
+        self.find_window.bind("<Escape>", lambda e: self.find_window.withdraw())
 
         label = tk.Label(self.find_window, text="Find text:")
         label.pack(anchor=tk.W, padx=10, pady=(10, 0))
@@ -353,7 +631,7 @@ class NoteApp:
         entry_frame = tk.Frame(self.find_window)
         entry_frame.pack(fill=tk.X, padx=10, pady=6)
         self.find_var = tk.StringVar()
-        entry = tk.Entry(entry_frame, textvariable=self.find_var)
+        entry = self.find_entry = tk.Entry(entry_frame, textvariable=self.find_var)
         entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         buttons = tk.Frame(self.find_window)
@@ -365,30 +643,80 @@ class NoteApp:
         btn_all.pack(side=tk.LEFT, padx=6)
         btn_clear.pack(side=tk.LEFT)
 
+        # Match-context preview: a Text peer shares the main widget's
+        # underlying buffer, so it costs no copy of the document (and the
+        # find_match tags render in it for free). It only exists in Tcl, so
+        # it is driven through tk.call by path name.
+        preview_path = f"{self.find_window._w}.preview"
+        # state is per-view, so disabling the peer makes it read-only
+        # without touching the main widget; typing into the preview would
+        # otherwise edit the shared document behind the refresh machinery.
+        self.text_area.peer_create(
+            preview_path, height=5, wrap="word", state="disabled", takefocus=0, borderwidth=1, relief="sunken"
+        )
+        self.root.tk.call("pack", preview_path, "-fill", "x", "-padx", 10, "-pady", (0, 10))
+        self._find_preview_path = preview_path
+
         entry.bind("<Return>", lambda e: self._find_next())
         entry.focus_set()
 
+    def _cancel_highlight_job(self) -> None:
+        if self._highlight_job is not None:
+            try:
+                self.root.after_cancel(self._highlight_job)
+            except Exception:
+                pass
+            self._highlight_job = None
+
     def _clear_find_highlights(self) -> None:
+        self._cancel_highlight_job()
+        self._find_ranges = []
         self.text_area.tag_remove("find_match", "1.0", tk.END)
         return None
 
+    def _invalidate_find_state(self) -> None:
+        # The buffer changed: every cached match describes the old content,
+        # and a scan still in flight is walking a stale snapshot. Drop the
+        # line.col ranges too, or the viewport pass keeps repainting tags at
+        # coordinates that no longer line up with the text.
+        self._cancel_highlight_job()
+        self._find_cache.clear()
+        self._find_next_cache = None
+        if self._find_ranges:
+            self._find_ranges = []
+            self.text_area.tag_remove("find_match", "1.0", tk.END)
+
     def _find_next(self) -> None:
+        self._cancel_highlight_job()
         pattern = (self.find_var.get() if hasattr(self, "find_var") else "").strip()
         if not pattern:
             return
-        start_index = self.text_area.index(tk.INSERT)
-        match_index = self.text_area.search(pattern, start_index, stopindex=tk.END, nocase=True)
-        if not match_index:
-            wrap_index = self.text_area.search(pattern, "1.0", stopindex=start_index, nocase=True)
-            if not wrap_index:
-                self.root.bell()
-                return
-            match_index = wrap_index
-        end_index = f"{match_index}+{len(pattern)}c"
+        # Scan once per (pattern, buffer) generation and memoize the match
+        # offsets; repeated Find Next presses are then a bisect over the
+        # cached list instead of a fresh O(N) scan.
+        key = pattern.lower()
+        cache = self._find_next_cache
+        if cache is None or cache[0] != key:
+            text = self.text_area.get("1.0", "end-1c")
+            self._rebuild_line_offsets(text)
+            cache = (key, _find_kernel.find_all(text, pattern))
+            self._find_next_cache = cache
+        offsets = cache[1]
+        if not offsets:
+            self.root.bell()
+            return
+        insert_offset = self._index_to_offset("insert")
+        k = bisect.bisect_left(offsets, insert_offset, key=lambda pair: pair[0])
+        if k >= len(offsets):
+            k = 0  # wrap around to the top
+        match_index = self._offset_to_index(offsets[k][0])
+        end_index = self._offset_to_index(offsets[k][1])
         self.text_area.tag_remove("sel", "1.0", tk.END)
         self.text_area.tag_add("sel", match_index, end_index)
         self.text_area.see(match_index)
         self.text_area.mark_set(tk.INSERT, end_index)
+        if self._find_preview_path is not None:
+            self.root.tk.call(self._find_preview_path, "see", match_index)
         self.text_area.focus_set()
 
     def _highlight_all(self) -> None:
@@ -396,14 +724,58 @@ class NoteApp:
         if not pattern:
             return
         self._clear_find_highlights()
-        start = "1.0"
-        while True:
-            match_index = self.text_area.search(pattern, start, stopindex=tk.END, nocase=True)
-            if not match_index:
-                break
-            end_index = f"{match_index}+{len(pattern)}c"
-            self.text_area.tag_add("find_match", match_index, end_index)
-            start = end_index
+        cached = self._find_cache.get(pattern.lower())
+        if cached is not None:
+            self._find_ranges = cached
+            self._refresh_visible_find_tags()
+            return
+        # Scan incrementally inside the event loop: a bounded batch of
+        # matches per tick, so typing and scrolling stay responsive while a
+        # huge buffer is swept. The scan itself is one buffer snapshot fed
+        # to a compiled regex, with offsets mapped back to line.col indices
+        # through the Python-side line-offset array — no per-match Tcl work.
+        text = self.text_area.get("1.0", "end-1c")
+        self._rebuild_line_offsets(text)
+        matches = _find_kernel.iter_matches(text, pattern)
+        self._highlight_acc = []
+        self._highlight_job = self.root.after_idle(self._highlight_step, matches, pattern)
+
+    def _highlight_step(self, matches, pattern: str) -> None:
+        self._highlight_job = None
+        acc = self._highlight_acc
+        append = acc.append
+        to_index = self._offset_to_index
+        for _ in range(500):
+            pair = next(matches, None)
+            if pair is None:
+                self._find_cache[pattern.lower()] = acc
+                self._find_ranges = acc
+                self._refresh_visible_find_tags()
+                return
+            append((to_index(pair[0]), to_index(pair[1])))
+        # More to scan: show what is already in view, then keep going.
+        self._find_ranges = acc
+        self._refresh_visible_find_tags()
+        self._highlight_job = self.root.after(1, self._highlight_step, matches, pattern)
+
+    def _refresh_visible_find_tags(self) -> None:
+        if not self._find_ranges:
+            return
+        self.text_area.tag_remove("find_match", "1.0", tk.END)
+        try:
+            top_line = int(self.text_area.index("@0,0").split(".")[0])
+            bot_line = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split(".")[0])
+        except tk.TclError:
+            return
+        start_line_of = lambda pair: int(pair[0].split(".")[0])
+        lo = bisect.bisect_left(self._find_ranges, top_line, key=start_line_of)
+        hi = bisect.bisect_right(self._find_ranges, bot_line, key=start_line_of)
+        visible = self._find_ranges[lo:hi]
+        # One tag_add per batch of ranges instead of one Tcl round-trip per
+        # match; batches stay well under Tcl's argument-count limits.
+        tag_add = self.text_area.tag_add
+        for i in range(0, len(visible), 1000):
+            tag_add("find_match", *[index for pair in visible[i:i + 1000] for index in pair])
 
     def show_about_dialog(self) -> None:
         if hasattr(self, "about_window") and self.about_window.winfo_exists():
@@ -422,8 +794,13 @@ class NoteApp:
         container = ttk.Frame(self.about_window, padding=16)
         container.pack(fill=tk.BOTH, expand=True)
 
-        title_font = tkfont.Font(family=self.ui_font.actual("family"), size=16, weight="bold")
-        subtitle_font = tkfont.Font(family=self.ui_font.actual("family"), size=11)
+        # Named fonts register with Tk; create them once and reuse across
+        # dialog opens.
+        if not hasattr(self, "_about_title_font"):
+            self._about_title_font = tkfont.Font(family=self.ui_font.actual("family"), size=16, weight="bold")
+            self._about_subtitle_font = tkfont.Font(family=self.ui_font.actual("family"), size=11)
+        title_font = self._about_title_font
+        subtitle_font = self._about_subtitle_font
 
         ttk.Label(container, text="Note", font=title_font).pack(anchor=tk.W)
         ttk.Label(
@@ -570,28 +947,23 @@ class NoteApp:
         self.text_font.configure(size=12)
 
     def _apply_theme(self) -> None:
-        if self.theme_mode == "dark":
-            bg = "#111827"
-            fg = "#e5e7eb"
-            panel_bg = "#0b1220"
-            gutter_bg = "#0f172a"
-            gutter_fg = "#94a3b8"
-            insert = "#60a5fa"
-            select_bg = "#374151"
-            status_bg = "#111827"
-            status_fg = "#9ca3af"
-            current_line_bg = "#111c2e"
-        else:
-            bg = "#ffffff"
-            fg = "#1f2937"
-            panel_bg = "#f8fafc"
-            gutter_bg = "#eef2f7"
-            gutter_fg = "#64748b"
-            insert = "#2563eb"
-            select_bg = "#dbeafe"
-            status_bg = "#f8fafc"
-            status_fg = "#6b7280"
-            current_line_bg = "#f7fbff"
+        # Re-applying a theme touches ~20 widget/style options; skip the whole
+        # pass when nothing that feeds it has changed.
+        applied_id = (self.theme_mode, self.text_font.cget("size"), self.wrap_enabled_var.get())
+        if applied_id == getattr(self, "_applied_theme_id", None):
+            return
+
+        p = self._palette = _THEMES[self.theme_mode]
+        bg = p["bg"]
+        fg = p["fg"]
+        panel_bg = p["panel_bg"]
+        gutter_bg = p["gutter_bg"]
+        gutter_fg = p["gutter_fg"]
+        insert = p["insert"]
+        select_bg = p["select_bg"]
+        status_bg = p["status_bg"]
+        status_fg = p["status_fg"]
+        current_line_bg = p["current_line_bg"]
 
         # ttk styles
         for style_name in ("TFrame", "TLabel", "TButton"):
@@ -619,7 +991,6 @@ class NoteApp:
             highlightthickness=1,
             highlightbackground=gutter_bg,
             font=self.text_font,
-            wrap=tk.WORD if self.wrap_enabled_var.get() else tk.NONE,
         )
         # Gutter
         self.line_numbers_canvas.configure(background=gutter_bg)
@@ -637,14 +1008,16 @@ class NoteApp:
 
         # Toolbar theme button label (plain text for portability)
         self.btn_theme.configure(text=("Light" if self.theme_mode == "dark" else "Dark"))
+        self._applied_theme_id = applied_id
 
     def toggle_theme(self) -> None:
         self.theme_mode = "dark" if self.theme_mode == "light" else "light"
         self._apply_theme()
 
     def toggle_wrap(self) -> None:
+        # Wrap is independent of the theme; one configure call is enough.
         self.text_area.configure(wrap=tk.WORD if self.wrap_enabled_var.get() else tk.NONE)
-        self._apply_theme()
+        self._update_line_numbers()
 
     def toggle_line_numbers(self) -> None:
         if self.show_line_numbers_var.get():
@@ -655,44 +1028,218 @@ class NoteApp:
 
     def _on_yscroll(self, first: str, last: str) -> None:
         self.scrollbar_y.set(first, last)
+        # Scrollbar updates can arrive far faster than the screen repaints;
+        # cap gutter/highlight redraws at roughly one per frame (~60 Hz).
+        self._gutter_dirty = True
+        if self._gutter_after_id is None:
+            self._gutter_after_id = self.root.after(16, self._flush_gutter)
+
+    def _flush_gutter(self) -> None:
+        self._gutter_after_id = None
+        if not self._gutter_dirty:
+            return
+        self._gutter_dirty = False
         self._update_line_numbers()
+        self._refresh_visible_find_tags()
 
     def _on_cursor_or_view_changed(self, event=None) -> None:
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        # Coalesce bursts of key/scroll events into a single trailing update,
+        # so fast typing does O(1) refresh work instead of one pass per event.
+        if self._pending_refresh is None:
+            self._pending_refresh = self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._pending_refresh = None
+        self._refresh_counts()
         self._highlight_current_line()
         self._update_line_numbers()
+        self._refresh_visible_find_tags()
+        self._schedule_status_update()
+
+    def _schedule_status_update(self) -> None:
+        # Trailing ~30 Hz debounce: during auto-repeat the label repaints at
+        # most once per 33 ms, after the burst pauses.
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+        self._status_after = self.root.after(33, self._flush_status_update)
+
+    def _flush_status_update(self) -> None:
+        self._status_after = None
         self._update_status_bar()
 
+    # ---- Document statistics ----
+    def _set_counts_from_text(self, content: str) -> None:
+        self._char_count = len(content)
+        self._word_count = _count_words(content)
+        self._line_count = content.count("\n") + 1
+        self._active_line = int(self.text_area.index("insert").split(".")[0])
+        self._active_line_text = self.text_area.get("insert linestart", "insert lineend")
+        self._active_line_words = _count_words(self._active_line_text)
+        self._rebuild_line_offsets(content)
+        # Any path that replaces the buffer wholesale lands here; drop the
+        # match caches built against the old content.
+        self._invalidate_find_state()
+
+    def _rebuild_line_offsets(self, content: str) -> None:
+        # Split on "\n" only: Tk's Text widget recognizes nothing else as a
+        # line separator, while splitlines() would also break on \x0b,
+        # \x0c, \x85, \u2028 and \u2029, skewing every offset <-> line.col
+        # conversion past the first such character (and disagreeing with
+        # _line_count's content.count("\n") + 1).
+        offsets = [0]
+        append = offsets.append
+        find = content.find
+        pos = find("\n")
+        while pos != -1:
+            append(pos + 1)
+            pos = find("\n", pos + 1)
+        if offsets[-1] < len(content):
+            # End-of-content sentinel so bisects over a final newline-less
+            # line resolve against a real upper bound.
+            append(len(content))
+        self._line_offsets = offsets
+
+    def _offset_to_index(self, offset: int) -> str:
+        line = bisect.bisect_right(self._line_offsets, offset, hi=len(self._line_offsets) - 1)
+        if line < 1:
+            line = 1
+        return f"{line}.{offset - self._line_offsets[line - 1]}"
+
+    def _index_to_offset(self, index: str) -> int:
+        line_str, col_str = self.text_area.index(index).split(".")
+        return self._line_offsets[int(line_str) - 1] + int(col_str)
+
+    def _recount_all(self) -> None:
+        self._set_counts_from_text(self.text_area.get("1.0", "end-1c"))
+
+    def _refresh_counts(self) -> None:
+        # Reconcile the cached statistics with whatever happened since the
+        # last refresh: plain cursor movement, a single-line edit, or a
+        # structural change. Only the last of those pays for a full recount.
+        total_lines = int(self.text_area.index("end-1c").split(".")[0])
+        line = int(self.text_area.index("insert").split(".")[0])
+        if total_lines != self._line_count:
+            self._invalidate_find_state()
+            self._recount_all()
+            return
+        counted = self.text_area.count("1.0", "end-1c", "chars")
+        chars = (counted[0] if isinstance(counted, tuple) else counted) or 0
+        if chars != self._char_count:
+            self._invalidate_find_state()
+            if line != self._active_line:
+                # The size changed away from the tracked line (e.g. a cut
+                # ending elsewhere): recount once.
+                self._recount_all()
+                return
+            # Single-line edit: shift the tail of the offset index by the
+            # size delta instead of rebuilding it.
+            delta = chars - self._char_count
+            self._char_count = chars
+            offsets = self._line_offsets
+            for k in range(line, len(offsets)):
+                offsets[k] += delta
+        text = self.text_area.get("insert linestart", "insert lineend")
+        if line == self._active_line:
+            if text != self._active_line_text:
+                # The line's content is the real edit signal: a selection
+                # replaced by same-length text (one coalesced event) leaves
+                # both the char and line counts untouched, so the size
+                # checks above never fire — invalidate here as well.
+                self._invalidate_find_state()
+                words = _count_words(text)
+                self._word_count += words - self._active_line_words
+                self._active_line_words = words
+                self._active_line_text = text
+        else:
+            self._active_line = line
+            self._active_line_words = _count_words(text)
+            self._active_line_text = text
+
     def _highlight_current_line(self) -> None:
-        self.text_area.tag_remove("current_line", 1.0, tk.END)
+        # Typing within a line keeps the same linestart; skip the
+        # remove/add/redraw cycle entirely in that (overwhelmingly common)
+        # case.
         index = self.text_area.index("insert linestart")
-        self.text_area.tag_add("current_line", index, f"{index} lineend+1c")
+        if self._current_line_range is not None:
+            if index == self._current_line_range[0]:
+                # A character typed at column 0 lands on the tag's left edge
+                # and doesn't inherit it (Tk only extends a tag for inserts
+                # strictly inside it); re-covering the first cell closes the
+                # gap without the full remove/add/redraw cycle.
+                self.text_area.tag_add("current_line", index, f"{index}+1c")
+                return
+            # Remove the tag only where it was last applied rather than
+            # sweeping every range in the whole document.
+            self.text_area.tag_remove("current_line", *self._current_line_range)
+        end = f"{index} lineend+1c"
+        self.text_area.tag_add("current_line", index, end)
+        self._current_line_range = (index, end)
+
+    def _place_gutter_item(self, slot: int, y: int, text: str) -> None:
+        # Reuse one canvas text item per visible line rather than destroying
+        # and recreating them every refresh; memory stays bounded by the
+        # maximum number of visible lines, not document length.
+        canvas = self.line_numbers_canvas
+        if slot < len(self._gutter_items):
+            item = self._gutter_items[slot]
+            canvas.coords(item, 44, y)
+            canvas.itemconfigure(item, text=text, fill=self.gutter_fg, state="normal")
+        else:
+            self._gutter_items.append(
+                canvas.create_text(44, y, anchor="ne", text=text, fill=self.gutter_fg, font=self.ui_font)
+            )
 
     def _update_line_numbers(self) -> None:
         if not self.show_line_numbers_var.get():
             return
-        self.line_numbers_canvas.delete("all")
+        slot = 0
         try:
-            i = self.text_area.index("@0,0")
+            top = int(self.text_area.index("@0,0").split(".")[0])
+            bottom = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split(".")[0])
         except tk.TclError:
             return
-        while True:
-            dline = self.text_area.dlineinfo(i)
-            if dline is None:
-                break
-            y = dline[1]
-            line = i.split(".")[0]
-            self.line_numbers_canvas.create_text(
-                44, y + 2, anchor="ne", text=line, fill=self.gutter_fg, font=self.ui_font
-            )
-            try:
-                i = self.text_area.index(f"{i}+1line")
-            except tk.TclError:
-                break
+        first = self.text_area.dlineinfo(f"{top}.0")
+        if first is not None:
+            if self.wrap_enabled_var.get():
+                # With wrap on, a logical line spans a variable number of
+                # display lines, so each one still needs its own y lookup —
+                # but the loop steps by plain integers instead of Tcl index
+                # arithmetic.
+                dlineinfo = self.text_area.dlineinfo
+                place = self._place_gutter_item
+                for ln in range(top, bottom + 1):
+                    dline = dlineinfo(f"{ln}.0")
+                    if dline is None:
+                        break
+                    place(slot, dline[1] + 2, str(ln))
+                    slot += 1
+            else:
+                # Without wrap every line is exactly one display line tall, so
+                # a single metrics query gives the step and all y coordinates
+                # come from Python-side arithmetic — no per-line Tcl
+                # round-trips.
+                step = (
+                    self.text_font.metrics("linespace")
+                    + int(str(self.text_area.cget("spacing1") or 0))
+                    + int(str(self.text_area.cget("spacing3") or 0))
+                )
+                y = first[1]
+                for ln in range(top, bottom + 1):
+                    self._place_gutter_item(slot, y + 2, str(ln))
+                    slot += 1
+                    y += step
+        for item in self._gutter_items[slot:]:
+            self.line_numbers_canvas.itemconfigure(item, state="hidden")
 
     def _adjust_font_size(self, delta: int) -> None:
+        # The Text widget uses the named font, so Tk propagates the new size
+        # on its own — only the gutter geometry needs a refresh.
         size = max(8, min(28, self.text_font.cget("size") + delta))
         self.text_font.configure(size=size)
-        self._apply_theme()
+        self._update_line_numbers()
 
     # =========================
     # Autosave
@@ -729,7 +1276,7 @@ class NoteApp:
         if not self.autosave_enabled_var.get():
             return
         try:
-            with open(self._autosave_path(), "w", encoding="utf-8") as f:
+            with open(self._autosave_path(), "w", encoding="utf-8", buffering=131072) as f:
                 f.write(self.text_area.get("1.0", "end-1c"))
         except Exception:
             # Intentionally swallow exceptions to avoid interrupting typing
@@ -744,12 +1291,14 @@ class NoteApp:
         if not os.path.exists(path):
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Same bulk pattern as _read_file: raw bytes, one decode.
+            with open(path, "rb") as f:
+                content = f.read().decode("utf-8")
             if content:
                 self.text_area.delete("1.0", tk.END)
                 self.text_area.insert("1.0", content)
                 self.is_modified = True
+                self._set_counts_from_text(content)
                 self._update_window_title()
                 self._update_status_bar()
         except Exception: